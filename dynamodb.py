@@ -1,8 +1,188 @@
 import boto3
+import cachetools
+import copy
+import functools
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Union, Literal
-from boto3.dynamodb.types import TypeDeserializer
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, make_dataclass
+from typing import Iterator, List, Optional, Dict, Tuple, Union, Literal
+from boto3.dynamodb.types import Binary, TypeSerializer
+from botocore.config import Config
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is the fallback
+    orjson = None
+
+# One session (and so one credential-resolution pass) shared by the whole
+# module, with a connection pool sized for long-lived processes. All three
+# are built lazily so importing the module doesn't construct a botocore
+# session or pin credentials in code paths that never touch DynamoDb.
+_CFG = Config(
+    max_pool_connections=int(os.getenv("DDB_POOL", "64")),
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+_SESSION = None
+_CLIENT = None
+_RESOURCE = None
+
+
+def _install_fast_json_parser():
+    """
+    botocore parses every DynamoDb response body with the stdlib json module
+    it imported in botocore.parsers; pointing that name at orjson swaps in a
+    much faster C parser (orjson.loads takes bytes directly and its
+    JSONDecodeError subclasses ValueError, so botocore's error handling is
+    unaffected). The patch is process-global - it changes parsing for every
+    botocore client of every service, and orjson is stricter than stdlib
+    json about NaN/Infinity tokens and invalid UTF-8 - so it is opt-in via
+    DDB_FAST_JSON=1 and a no-op when orjson isn't installed.
+    """
+    if orjson is None or os.getenv("DDB_FAST_JSON") != "1":
+        return
+    import botocore.parsers
+    botocore.parsers.json = orjson
+
+
+def _session() -> 'boto3.session.Session':
+    global _SESSION
+    if _SESSION is None:
+        _install_fast_json_parser()
+        _SESSION = boto3.session.Session()
+    return _SESSION
+
+
+def _client() -> 'boto3.client':
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = _session().client("dynamodb", config=_CFG)
+    return _CLIENT
+
+
+def _resource() -> 'boto3.resource':
+    global _RESOURCE
+    if _RESOURCE is None:
+        _RESOURCE = _session().resource("dynamodb", config=_CFG)
+    return _RESOURCE
+
+# The serializer is stateless, one instance is enough for the whole module.
+_SERIALIZE = TypeSerializer().serialize
+
+
+def _deserialize(attribute_value: Dict) -> any:
+    """
+    Turns one AttributeValue dict ({'S': ...}, {'N': ...}, ...) into its
+    Python value with a single dict lookup on the type tag, instead of
+    TypeDeserializer's if/elif chain per value. Matches TypeDeserializer's
+    output types (Decimal for numbers, Binary for bytes, set for sets).
+    """
+    (tag, value), = attribute_value.items()
+    return _TAG_DISPATCH[tag](value)
+
+
+_TAG_DISPATCH = {
+    'S': str,
+    'N': Decimal,
+    'B': Binary,
+    'BOOL': bool,
+    'NULL': lambda value: None,
+    'SS': set,
+    'NS': lambda values: set(map(Decimal, values)),
+    'BS': lambda values: {Binary(value) for value in values},
+    'L': lambda values: [_deserialize(value) for value in values],
+    'M': lambda values: {key: _deserialize(value) for key, value in values.items()},
+}
+
+_DESERIALIZE = _deserialize
+
+# Read-aside cache for the read functions, one TTLCache per distinct ttl.
+# Writes bump the owning table's generation, which is mixed into every
+# cache key, so stale entries simply stop being found.
+_READ_CACHE_LOCK = threading.RLock()
+_READ_CACHES: Dict[float, cachetools.TTLCache] = {}
+_TABLE_GENERATIONS: Dict[str, int] = {}
+
+
+# Short-lived cache for hot get_item keys (config rows, per-user settings).
+# Writes evict the affected key below; DDB_GET_TTL=0 disables it entirely.
+_GET_TTL = float(os.getenv('DDB_GET_TTL', '5'))
+_GET_CACHE = cachetools.TTLCache(maxsize=4096, ttl=_GET_TTL or 1)
+_GET_CACHE_LOCK = threading.Lock()
+
+
+def _get_cache_key(table_name: str, primary_key: 'Key', sort_key: Optional['Key']) -> Tuple:
+    return (
+        table_name,
+        primary_key.key,
+        primary_key.value,
+        sort_key.key if sort_key else None,
+        sort_key.value if sort_key else None,
+    )
+
+
+def _evict_get(table_name: str, primary_key: 'Key', sort_key: Optional['Key'] = None):
+    with _GET_CACHE_LOCK:
+        _GET_CACHE.pop(_get_cache_key(table_name, primary_key, sort_key), None)
+
+
+def _evict_gets_for_table(table_name: str):
+    with _GET_CACHE_LOCK:
+        for cache_key in list(_GET_CACHE):
+            if cache_key[0] == table_name:
+                _GET_CACHE.pop(cache_key, None)
+
+
+def _evict_gets_for_item(table_name: str, item: Dict[str, any]):
+    # The cached keys carry the key names, so an inserted item can be matched
+    # against them without knowing the table's key schema.
+    with _GET_CACHE_LOCK:
+        for cache_key in list(_GET_CACHE):
+            cached_table, pk_name, pk_value, sk_name, sk_value = cache_key
+            if cached_table != table_name:
+                continue
+            if item.get(pk_name) == pk_value and (sk_name is None or item.get(sk_name) == sk_value):
+                _GET_CACHE.pop(cache_key, None)
+
+
+def _bump_table_generation(table_name: str):
+    with _READ_CACHE_LOCK:
+        _TABLE_GENERATIONS[table_name] = _TABLE_GENERATIONS.get(table_name, 0) + 1
+
+
+def _read_cache_key(table_name: str, request: Dict) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(_TABLE_GENERATIONS.get(table_name, 0)).encode())
+    digest.update(json.dumps(request, sort_keys=True, default=str).encode())
+    return digest.digest()
+
+
+def _cached_read(table_name: str, request: Dict, cache_ttl: Optional[float], fetch, client=None):
+    # A custom client may point at another region/endpoint, so only the
+    # shared client's results may live in the shared cache
+    if not cache_ttl or (client is not None and client is not _CLIENT):
+        return fetch()
+
+    key = _read_cache_key(table_name, request)
+    with _READ_CACHE_LOCK:
+        cache = _READ_CACHES.get(cache_ttl)
+        if cache is None:
+            cache = _READ_CACHES[cache_ttl] = cachetools.TTLCache(maxsize=1024, ttl=cache_ttl)
+        if key in cache:
+            return cache[key]
+
+    items = fetch()
+    with _READ_CACHE_LOCK:
+        cache[key] = items
+    return items
 
 
 @dataclass
@@ -11,59 +191,74 @@ class Key:
     value: any
 
 
-def get_inserter(key: str, value: any):
-    if isinstance(value, (int, float)):
-        return f"'{key}' : {value},"
-    return f"'{key}' : '{value}',"
+def make_row_type(name: str, columns: List[str]) -> type:
+    """
+    Builds a frozen __slots__ dataclass to hold scan results. Rows take far
+    less memory than dicts and attribute access beats dict lookup; column
+    names are interned once here instead of duplicated per row.
+    """
+    return make_dataclass(name, [sys.intern(column) for column in columns], slots=True, frozen=True)
 
 
-def generate_partiql_insert_statement(item: Dict[str, any], table_name: str) -> str:
+def generate_partiql_insert_statement(item: Dict[str, any], table_name: str) -> Tuple[str, List[Dict]]:
     """
     Function that for given item formulates PartiQl statement and returns it
-    in a form of string that can be later executed/batch_executed via the
-    execute_partiql_statement/batch_execute_partiql_statement functions.
+    as a (statement, parameters) pair that can be later executed/batch_executed
+    via the execute_partiql_statement/batch_execute_partiql_statement functions.
+    Values travel as ? parameters in AttributeValue encoding, so no quoting
+    logic and no injection through item values.
     Upon execution inserts given item into dynamodb table with the specified table_name.
     """
-    statement = f'INSERT INTO "{table_name}" value {{'
-
-    for key, value in item.items():
-        statement += get_inserter(key, value)
-
-    return statement.rstrip(",") + "}"
+    body = ",".join(f"'{key}' : ?" for key in item)
+    parameters = [_SERIALIZE(value) for value in item.values()]
+    return f'INSERT INTO "{table_name}" value {{{body}}}', parameters
 
 
 def insert_item(
     item: Dict[str, any],
     table_name: str,
-    dynamodb: Optional['boto3.resource'] = boto3.resource('dynamodb')
+    dynamodb_client: Optional['boto3.client'] = None
 ):
     """
     Inserts item into DynamoDb table
     """
-    table = dynamodb.Table(table_name)
-    return table.put_item(Item=item)
+    if dynamodb_client is None:
+        dynamodb_client = _client()
+    _bump_table_generation(table_name)
+    _evict_gets_for_item(table_name, item)
+    return dynamodb_client.put_item(
+        TableName=table_name,
+        Item={k: _SERIALIZE(v) for k, v in item.items()},
+    )
 
 
 def query_table(
     table_name: str,
     key_condition_expression: str,
     expression_attribute_values: Dict[str, Dict[str, str]],
-    dynamo_db_client: boto3.client = boto3.client('dynamodb'),
+    dynamo_db_client: Optional['boto3.client'] = None,
     secondary_index_name: Optional[str] = None,
     next_token: Optional[dict] = None,
     limit: int = 100,
+    cache_ttl: Optional[float] = None,
+    page_size: Optional[int] = None,
 ) -> List[Dict]:
     """
     Query DynamoDb table using boto3's parameters.
+    Pass cache_ttl to serve repeated queries from a local cache for that many seconds.
+    page_size overrides limit as the per-request item cap when paging
+    manually with next_token.
     Returns items in a nice deserialized way.
     """
     try:
-        deserializer = TypeDeserializer()
+        if dynamo_db_client is None:
+            dynamo_db_client = _client()
+        _d = _DESERIALIZE
         query_params = {
             "TableName": table_name,
             "KeyConditionExpression": key_condition_expression,
             "ExpressionAttributeValues": expression_attribute_values,
-            "Limit": limit,
+            "Limit": page_size if page_size else limit,
         }
 
         if secondary_index_name:
@@ -71,83 +266,155 @@ def query_table(
         if next_token:
             query_params["ExclusiveStartKey"] = next_token
 
-        response = dynamo_db_client.query(**query_params)
-        return [
-            {k: deserializer.deserialize(v) for k, v in item.items()}
-            for item in response.get('Items', [])
-        ]
+        def fetch():
+            response = dynamo_db_client.query(**query_params)
+            return [
+                dict(zip(item, map(_d, item.values())))
+                for item in response.get('Items', [])
+            ]
+
+        return _cached_read(table_name, query_params, cache_ttl, fetch, dynamo_db_client)
 
     except Exception as e:
         logging.error(f"Querying table: {table_name}, failed: {str(e)}")
         raise e
 
 
+def iter_scan_table(
+    table_name: str,
+    dynamodb_client: Optional[any] = None,
+    row_type: Optional[type] = None,
+) -> Iterator[any]:
+    """
+    Lazily scans a dynamoDB table, yielding one deserialized item at a time.
+    Only the current page is ever held in memory, so huge tables can be
+    streamed instead of materialized.
+    Pass a row_type (see make_row_type) to get compact slotted rows instead
+    of one dict per item.
+    """
+    if dynamodb_client is None:
+        dynamodb_client = _client()
+    paginator = dynamodb_client.get_paginator("scan")
+    _d = _DESERIALIZE
+
+    # Ask for the biggest pages DynamoDb will serve to minimize round-trips
+    pages = iter(paginator.paginate(TableName=table_name, PaginationConfig={"PageSize": 1000}))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Fetch the next page in the background while the current one is
+        # being deserialized, overlapping network wait with CPU work.
+        future = pool.submit(next, pages, None)
+        while True:
+            page = future.result()
+            if page is None:
+                return
+            future = pool.submit(next, pages, None)
+            for item in page.get("Items", ()):
+                row = dict(zip(item, map(_d, item.values())))
+                yield row if row_type is None else row_type(**row)
+
+
 def scan_table(
     table_name: str,
-    dynamodb_client: Optional[any] = boto3.client('dynamodb')
-) -> List[dict]:
+    dynamodb_client: Optional[any] = None,
+    cache_ttl: Optional[float] = None,
+    row_type: Optional[type] = None,
+) -> List[any]:
     """
     Returns scan of shared memory dynamoDB table.
+    Pass cache_ttl to serve repeated scans from a local cache for that many seconds.
     Returns items in a nice deserialized way.
     """
-    items = []
-    paginator = dynamodb_client.get_paginator("scan")
-    deserializer = TypeDeserializer()
-
-    for page in paginator.paginate(TableName=table_name):
-        page_items = page.get("Items", [])
-        items.extend(
-            [
-                {k: deserializer.deserialize(v) for k, v in item.items()}
-                for item in page_items
-            ]
-        )
+    return _cached_read(
+        table_name,
+        {"TableName": table_name, "RowType": row_type},
+        cache_ttl,
+        lambda: list(iter_scan_table(table_name, dynamodb_client, row_type)),
+        dynamodb_client,
+    )
 
-    return items
+
+def count_table(
+    table_name: str,
+    dynamodb_client: Optional[any] = None,
+) -> int:
+    """
+    Counts items in the table without shipping any of them over the network,
+    Select='COUNT' pages carry only the count.
+    """
+    if dynamodb_client is None:
+        dynamodb_client = _client()
+    paginator = dynamodb_client.get_paginator("scan")
+    return sum(
+        page["Count"]
+        for page in paginator.paginate(TableName=table_name, Select="COUNT")
+    )
 
 
 def select_items(
         primary_key: Key,
         table_name: str,  # Should work with indexes if you look into it
         column_names: Optional[Union[List[str], Literal['*']]] = '*',
-        dynamo_db_client: Optional['boto3.client'] = boto3.client('dynamodb'),
+        dynamo_db_client: Optional['boto3.client'] = None,
+        cache_ttl: Optional[float] = None,
 ) -> List[dict]:
     """
-    For specific primary_key value get all items that are stored in the given dynamo table. (Using PartiQl)
+    For specific primary_key value get all items that are stored in the given dynamo table.
+    Pass cache_ttl to serve repeated selects from a local cache for that many seconds.
     Returns items in a nice deserialized way.
     """
-    deserializer = TypeDeserializer()
+    if dynamo_db_client is None:
+        dynamo_db_client = _client()
+    _d = _DESERIALIZE
+
+    query_params = {
+        "TableName": table_name,
+        "KeyConditionExpression": "#pk = :pk",
+        "ExpressionAttributeNames": {"#pk": primary_key.key},
+        "ExpressionAttributeValues": {":pk": _SERIALIZE(primary_key.value)},
+    }
 
     if column_names != '*':
-        holder = column_names
-        column_names = ''
-        for name in holder:
-            column_names += f'{name}, '
-        column_names.rstrip(',').rstrip()
-
-    if not isinstance(primary_key.value, (int, float)):
-        primary_key.value = f"'{primary_key.value}'"
-
-    column_names += ' '
-    response = dynamo_db_client.execute_statement(
-        Statement=f"""SELECT {column_names}FROM "{table_name}" WHERE {primary_key.key} = {primary_key.value}""",
-    )
+        # Alias every projected column so reserved words can't collide
+        aliases = {f"#c{i}": name for i, name in enumerate(column_names)}
+        query_params["ProjectionExpression"] = ", ".join(aliases)
+        query_params["ExpressionAttributeNames"].update(aliases)
+
+    def fetch():
+        response = dynamo_db_client.query(**query_params)
+        return [
+            dict(zip(item, map(_d, item.values())))
+            for item in response.get('Items', [])
+        ]
 
-    return [
-        {k: deserializer.deserialize(v) for k, v in item.items()}
-        for item in response.get('Items', [])
-    ]
+    return _cached_read(table_name, query_params, cache_ttl, fetch, dynamo_db_client)
 
 
 def get_item(
     primary_key: Key,
     table_name: str,
     sort_key: Optional[Key] = None,
-    dynamodb_resource: Optional['boto3.resource("dynamodb").Table'] = boto3.resource("dynamodb")
+    dynamodb_resource: Optional['boto3.resource("dynamodb").Table'] = None
 ):
     """
     Gets item with given primary/sort key combination from the table.
+    Hot keys are served from a short TTL cache (see DDB_GET_TTL).
     """
+    # A custom resource may point at another region/endpoint, so only the
+    # shared resource is allowed to touch the shared cache
+    use_cache = _GET_TTL > 0 and (dynamodb_resource is None or dynamodb_resource is _RESOURCE)
+    cache_key = _get_cache_key(table_name, primary_key, sort_key)
+    if use_cache:
+        with _GET_CACHE_LOCK:
+            try:
+                # Deep-copied both ways so callers mutating the fetched item
+                # can't rewrite the cached entry behind everyone's back
+                return copy.deepcopy(_GET_CACHE[cache_key])
+            except KeyError:
+                # Missing, or expired between any check and the lookup
+                pass
+
+    if dynamodb_resource is None:
+        dynamodb_resource = _resource()
     table = dynamodb_resource.Table(table_name)
     key = {
         primary_key.key: primary_key.value,
@@ -156,44 +423,149 @@ def get_item(
     if sort_key:
         key[sort_key.key] = sort_key.value
 
-    return table.get_item(Key=key).get('Item')
+    item = table.get_item(Key=key).get('Item')
+    if use_cache:
+        with _GET_CACHE_LOCK:
+            _GET_CACHE[cache_key] = copy.deepcopy(item)
+    return item
 
 
-def truncate_table(table_name: str, dynamo: boto3.resource = boto3.resource('dynamodb')):
+@functools.lru_cache(maxsize=256)
+def _key_projection(table_name: str) -> Tuple[str, Dict[str, str], Tuple[str, ...]]:
     """
-    Truncates table by scanning it (returns 1MB chunks) than deleting the chunks as batch operation.
+    Caches the key-only projection pieces per table, so repeated truncates
+    of the same table don't re-describe its schema or rebuild the alias
+    strings. Key names are interned once since they recur on every page.
     """
-    table = dynamo.Table(table_name)
+    table = _resource().Table(table_name)
+    names = tuple(sys.intern(key.get("AttributeName")) for key in table.key_schema)
+    projection = ", ".join("#" + name for name in names)
+    attr_names = {"#" + name: name for name in names}
+    return projection, attr_names, names
 
-    # get the table keys
-    table_key_names = [key.get("AttributeName") for key in table.key_schema]
 
-    # Only retrieve the keys for each item in the table (minimize data transfer)
-    projection_expression = ", ".join("#" + key for key in table_key_names)
-    expression_attr_names = {"#" + key: key for key in table_key_names}
+def truncate_table(
+    table_name: str,
+    dynamo: Optional['boto3.resource'] = None,
+    total_segments: Optional[int] = None,
+    partition_values: Optional[List[any]] = None,
+):
+    """
+    Truncates table with a parallel scan (Segment/TotalSegments) feeding
+    25-item BatchWriteItem deletes, so throughput is bounded by the table's
+    provisioned WCU instead of a single scan thread.
+    If the caller can enumerate the partition key values, pass them as
+    partition_values and keys are fetched with cheap per-partition Queries
+    instead of scanning the whole table.
+    """
+    if dynamo is None:
+        dynamo = _resource()
+    table = dynamo.Table(table_name)
+    client = table.meta.client
 
-    page = table.scan(
-        ProjectionExpression=projection_expression,
-        ExpressionAttributeNames=expression_attr_names,
-    )
+    # Only retrieve the keys for each item in the table (minimize data transfer)
+    if dynamo is _RESOURCE:
+        projection_expression, expression_attr_names, table_key_names = _key_projection(table_name)
+    else:
+        # Custom resource (other region/endpoint), can't use the shared cache
+        table_key_names = [key.get("AttributeName") for key in table.key_schema]
+        projection_expression = ", ".join("#" + key for key in table_key_names)
+        expression_attr_names = {"#" + key: key for key in table_key_names}
+
+    if total_segments is None:
+        total_segments = min((os.cpu_count() or 1) * 2, 16)
+
+    _bump_table_generation(table_name)
+    _evict_gets_for_table(table_name)
+
+    key_queue = queue.Queue(maxsize=total_segments * 100)
+    done = object()
+
+    def scan_segment(segment: int):
+        # The paginator handles LastEvaluatedKey plus throttling retries
+        paginator = client.get_paginator("scan")
+        for page in paginator.paginate(
+            TableName=table_name,
+            ProjectionExpression=projection_expression,
+            ExpressionAttributeNames=expression_attr_names,
+            Segment=segment,
+            TotalSegments=total_segments,
+        ):
+            for item_keys in page.get("Items", ()):
+                key_queue.put(item_keys)
+
+    def query_partition(value: any):
+        paginator = client.get_paginator("query")
+        for page in paginator.paginate(
+            TableName=table_name,
+            KeyConditionExpression=f"#{table_key_names[0]} = :pk",
+            ProjectionExpression=projection_expression,
+            ExpressionAttributeNames=expression_attr_names,
+            ExpressionAttributeValues={":pk": _SERIALIZE(value)},
+        ):
+            for item_keys in page.get("Items", ()):
+                key_queue.put(item_keys)
+
+    writer_errors = []
+
+    def delete_batches():
+        finished = False
+        try:
+            while not (finished and key_queue.empty()):
+                chunk = []
+                while len(chunk) < 25:
+                    item_keys = key_queue.get()
+                    if item_keys is done:
+                        finished = True
+                        break
+                    chunk.append(item_keys)
+
+                requests = [{"DeleteRequest": {"Key": k}} for k in chunk]
+                backoff = 0.05
+                while requests:
+                    response = client.batch_write_item(RequestItems={table_name: requests})
+                    requests = response.get("UnprocessedItems", {}).get(table_name, [])
+                    if requests:
+                        # Throttled - back off and retry what DynamoDb rejected
+                        time.sleep(backoff)
+                        backoff = min(backoff * 2, 5)
+        except Exception as e:
+            writer_errors.append(e)
+            if not finished:
+                # Keep draining so scanners blocked on the bounded queue can
+                # finish. Skipped once the sentinel was consumed - there is
+                # only one, so blocking on the empty queue would hang forever
+                while key_queue.get() is not done:
+                    pass
+
+    writer = threading.Thread(target=delete_batches)
+    writer.start()
 
-    with table.batch_writer() as batch:
-        while page["Count"] > 0:
-            # Delete items in batches
-            for itemKeys in page["Items"]:
-                batch.delete_item(Key=itemKeys)
-            # Fetch the next page
-            if "LastEvaluatedKey" in page:
-                page = table.scan(
-                    ProjectionExpression=projection_expression,
-                    ExpressionAttributeNames=expression_attr_names,
-                    ExclusiveStartKey=page["LastEvaluatedKey"],
-                )
+    try:
+        with ThreadPoolExecutor(max_workers=total_segments) as pool:
+            if partition_values is not None:
+                futures = [pool.submit(query_partition, value) for value in partition_values]
             else:
-                return 'Table successfully truncated'
+                futures = [pool.submit(scan_segment, i) for i in range(total_segments)]
+            for future in futures:
+                future.result()
+    finally:
+        # Always unblock and reap the writer, even when a scanner raised
+        key_queue.put(done)
+        writer.join()
 
+    if writer_errors:
+        raise writer_errors[0]
 
-def delete_item(table_name: str, primary_key: Key, sort_key: Optional[Key] = None):
+    return 'Table successfully truncated'
+
+
+def delete_item(
+    table_name: str,
+    primary_key: Key,
+    sort_key: Optional[Key] = None,
+    dynamodb_client: Optional['boto3.client'] = None,
+):
     """
     Deletes item from DynamoDb.
     """
@@ -204,10 +576,15 @@ def delete_item(table_name: str, primary_key: Key, sort_key: Optional[Key] = Non
     if sort_key:
         key[sort_key.key] = sort_key.value
 
-    dynamodb = boto3.resource('dynamodb')
-    table = dynamodb.Table(table_name)
+    if dynamodb_client is None:
+        dynamodb_client = _client()
 
-    return table.delete_item(Key=key)
+    _bump_table_generation(table_name)
+    _evict_get(table_name, primary_key, sort_key)
+    return dynamodb_client.delete_item(
+        TableName=table_name,
+        Key={k: _SERIALIZE(v) for k, v in key.items()},
+    )
 
 
 def increment_counter(
@@ -215,89 +592,217 @@ def increment_counter(
         sort_key: Key,
         counter_name: str,
         table_name: str,
-        dynamodb: Optional['boto3.resource()'] = boto3.resource('dynamodb')
+        dynamodb_client: Optional['boto3.client'] = None
 ):
     """
     Function with niche usability that increments a counter column inside the DynamoDb table.
     """
-    table = dynamodb.Table(table_name)
-    return table.update_item(
+    if dynamodb_client is None:
+        dynamodb_client = _client()
+    _bump_table_generation(table_name)
+    _evict_get(table_name, primary_key, sort_key)
+    return dynamodb_client.update_item(
+        TableName=table_name,
         Key={
-            primary_key.key: primary_key.value,
-            sort_key.key: sort_key.value
+            primary_key.key: _SERIALIZE(primary_key.value),
+            sort_key.key: _SERIALIZE(sort_key.value)
         },
         UpdateExpression=f'SET {counter_name} = {counter_name} + :val',
         ExpressionAttributeValues={
-            ':val': 1
+            ':val': _SERIALIZE(1)
         }
     )
 
 
-def get_setter(key: str, value) -> str:
-    if isinstance(value, (int, float)):
-        return f" SET {key} = {value}"
-    return f" SET {key} = '{value}'"
-
-
 def generate_partiql_update_statement(
     primary_key: Key,
     non_key_values: Dict[str, any],
     table_name,
     sort_key: Optional[Key] = None,
-) -> str:
+) -> Tuple[str, List[Dict]]:
     """
         Function that for given item formulates PartiQl statement and returns it
-        in a form of string that can be later executed/batch_executed via the
-        execute_partiql_statement/batch_execute_partiql_statement functions.
+        as a (statement, parameters) pair that can be later executed/batch_executed
+        via the execute_partiql_statement/batch_execute_partiql_statement functions.
+        Values travel as ? parameters in AttributeValue encoding, so no quoting
+        logic and no injection through item values.
         Upon execution updates given item that already must be inside the dynamodb
         table with the specified table_name.
         """
-    statement = f'UPDATE "{table_name}"'
-
-    for key, value in non_key_values.items():
-        statement += get_setter(key, value)
+    setters = " ".join(f"SET {key} = ?" for key in non_key_values)
+    parameters = [_SERIALIZE(value) for value in non_key_values.values()]
+    parameters.append(_SERIALIZE(primary_key.value))
 
-    statement += f" WHERE {primary_key.key} = '{primary_key.value}' AND {sort_key.key} = '{sort_key.value}'" if \
-        sort_key else f" WHERE {primary_key.key} = '{primary_key.value}''"
+    where = f"WHERE {primary_key.key} = ?"
+    if sort_key:
+        where += f" AND {sort_key.key} = ?"
+        parameters.append(_SERIALIZE(sort_key.value))
 
-    return statement
+    return f'UPDATE "{table_name}" {setters} {where}', parameters
 
 
 def execute_partiql_statement(
     statement: str,
-    dynamodb_client: 'boto3.client' = boto3.client('dynamodb')
+    dynamodb_client: Optional['boto3.client'] = None,
+    parameters: Optional[List[Dict]] = None,
 ):
     """
-    Executes a PartiQL statement.
+    Executes a PartiQL statement, optionally with ? parameters.
     """
+    if dynamodb_client is None:
+        dynamodb_client = _client()
+    if parameters:
+        return dynamodb_client.execute_statement(Statement=statement, Parameters=parameters)
     return dynamodb_client.execute_statement(Statement=statement)
 
 
 def batch_execute_partiql_statement(
     statements: List[Dict[str, str]],
-    dynamodb_client: 'boto3.client' = boto3.client('dynamodb')
+    dynamodb_client: Optional['boto3.client'] = None
 ):
     """
     Executes a list of PartiQL statements in a batch.
+    Each entry may carry its own 'Parameters' next to its 'Statement'.
     """
+    if dynamodb_client is None:
+        dynamodb_client = _client()
     return dynamodb_client.batch_execute_statement(Statements=statements)
 
 
+# Per-statement errors worth retrying in PartiQLBatcher.flush; anything
+# else (validation, missing table, ...) would just fail again.
+_RETRYABLE_BATCH_ERRORS = {
+    "ThrottlingError",
+    "ThrottlingException",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "InternalServerError",
+}
+
+
+class PartiQLBatcher:
+    """
+    Accumulates PartiQL statements and dispatches them in
+    batch_execute_statement calls of up to 25 (the DynamoDb batch limit),
+    so callers that used to loop execute_partiql_statement per row pay one
+    round-trip per 25 statements. Works as a context manager and flushes
+    whatever is left on exit.
+    """
+
+    def __init__(self, dynamodb_client: Optional['boto3.client'] = None, size: int = 25):
+        self.client = dynamodb_client
+        self.size = min(size, 25)
+        self.buf: List[Dict] = []
+
+    def add(self, statement: str, parameters: Optional[List[Dict]] = None):
+        entry = {'Statement': statement}
+        if parameters:
+            entry['Parameters'] = parameters
+        self.buf.append(entry)
+        if len(self.buf) >= self.size:
+            self.flush()
+
+    def flush(self):
+        if not self.buf:
+            return
+        if self.client is None:
+            self.client = _client()
+
+        batch, self.buf = self.buf, []
+        backoff = 0.05
+        failed = []
+        while batch:
+            response = self.client.batch_execute_statement(Statements=batch)
+            # Retry the statements that came back throttled; anything else
+            # that errored is a hard failure and must not vanish silently
+            retry = []
+            for statement, item in zip(batch, response.get('Responses', [])):
+                error = item.get('Error')
+                if not error:
+                    continue
+                if error.get('Code') in _RETRYABLE_BATCH_ERRORS:
+                    retry.append(statement)
+                else:
+                    failed.append((statement, error))
+            batch = retry
+            if batch:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 5)
+
+        if failed:
+            for statement, error in failed:
+                logging.error(
+                    f"PartiQL statement failed: {error.get('Code')}: {error.get('Message')}, "
+                    f"statement: {statement['Statement']}"
+                )
+            raise RuntimeError(f"{len(failed)} PartiQL statement(s) failed in batch")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+
 class DynamoDB:
     def __init__(self, table_name: str) -> None:
         self.table_name = table_name
-        self.client = boto3.client('dynamodb')
-        self.resource = boto3.resource('dynamodb')
+        self.client = _client()
+        self.resource = _resource()
         self.table = self.resource.Table(table_name)
 
     def insert_item(self, item: Dict[str, any]):
-        return insert_item(item, self.table_name, self.resource)
+        return insert_item(item, self.table_name, self.client)
+
+    def batch_insert(self, items: List[Dict[str, any]], max_workers: int = 1):
+        """
+        Inserts items through batch_writer, which groups them into 25-item
+        BatchWriteItem calls and retries UnprocessedItems. With max_workers > 1
+        the items are split across parallel writer contexts.
+        """
+        _bump_table_generation(self.table_name)
+        _evict_gets_for_table(self.table_name)
+
+        def write_shard(shard: List[Dict[str, any]]):
+            with self.table.batch_writer() as batch:
+                for item in shard:
+                    batch.put_item(Item=item)
+
+        if max_workers <= 1:
+            return write_shard(items)
+
+        shards = [items[i::max_workers] for i in range(max_workers)]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for future in [pool.submit(write_shard, shard) for shard in shards if shard]:
+                future.result()
+
+    def batch_delete(self, keys: List[Dict[str, any]], max_workers: int = 1):
+        """
+        Deletes items by key through batch_writer, same batching behaviour
+        as batch_insert.
+        """
+        _bump_table_generation(self.table_name)
+        _evict_gets_for_table(self.table_name)
+
+        def delete_shard(shard: List[Dict[str, any]]):
+            with self.table.batch_writer() as batch:
+                for key in shard:
+                    batch.delete_item(Key=key)
+
+        if max_workers <= 1:
+            return delete_shard(keys)
+
+        shards = [keys[i::max_workers] for i in range(max_workers)]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for future in [pool.submit(delete_shard, shard) for shard in shards if shard]:
+                future.result()
 
     def get_item(self, primary_key: Key, sort_key: Key):
         return get_item(primary_key, self.table_name, sort_key, self.resource)
 
-    def scan(self):
-        return scan_table(self.table_name, self.client)
+    def scan(self, cache_ttl: Optional[float] = None):
+        return scan_table(self.table_name, self.client, cache_ttl)
 
     def delete_item(self, primary_key: Key, sort_key: Key):
         return delete_item(self.table_name, primary_key, sort_key)